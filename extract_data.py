@@ -1,10 +1,16 @@
 import re
+import functools
 import unicodedata
-import datetime
+import calendar
 from difflib import get_close_matches
 from typing import Optional, Dict, Any, List, Tuple
 from parser import pdf_parser
 
+try:
+    from rapidfuzz import process as fuzz_process, fuzz
+except ImportError:  # sem rapidfuzz: similaridade via difflib
+    fuzz_process = None
+
 # -----------------------
 # Utilitários
 # -----------------------
@@ -12,14 +18,34 @@ def normalize_text(s: Optional[str]) -> Optional[str]:
     """Remove acentos e normaliza espaços; útil para limpar nomes."""
     if not s:
         return s
-    s = unicodedata.normalize('NFD', s)
-    s = ''.join(ch for ch in s if unicodedata.category(ch) != 'Mn')
-    s = re.sub(r'\s+', ' ', s)
+    # texto só ASCII não tem acentos a decompor: dispensa o NFD e o filtro caractere a caractere
+    if not s.isascii():
+        s = unicodedata.normalize('NFD', s)
+        s = ''.join(ch for ch in s if unicodedata.category(ch) != 'Mn')
+    s = _RE_WS.sub(' ', s)
     return s.strip()
 
 def normalize_upper(s: Optional[str]) -> Optional[str]:
     return normalize_text(s).upper() if s else s
 
+def _search_by_priority(pattern: re.Pattern, txt: str, endpos: Optional[int] = None) -> Optional[re.Match]:
+    """
+    Varre `txt` (até `endpos`) com uma alternação de grupos (um grupo externo por
+    alternativa) e retorna o match da alternativa declarada primeiro, como fariam
+    buscas sequenciais por alternativa. O índice do grupo externo (`lastindex`) dá a prioridade.
+    """
+    if endpos is None:
+        endpos = len(txt)
+    best = None
+    m = pattern.search(txt, 0, endpos)
+    while m:
+        if best is None or m.lastindex < best.lastindex:
+            best = m
+            if best.lastindex == 1:
+                break
+        m = pattern.search(txt, m.start() + 1, endpos)
+    return best
+
 # -----------------------
 # Configurações / listas
 # -----------------------
@@ -33,6 +59,7 @@ ROLE_LABELS = [
     'AGRAVANTE','AGRAVADO','RECORRENTE','RECORRIDO',
     'EMBARGANTE','EMBARGADO','AUTOR','REU','RÉU','INTERESSADO'
 ]
+_ROLE_SET = frozenset(ROLE_LABELS)
 
 OUTCOME_PATTERNS = {
     'negar_provimento': [r'NEGA[MR]? PROVIMENTO', r'NEGAR PROVIMENTO', r'NEGA-SE PROVIMENTO'],
@@ -43,13 +70,101 @@ OUTCOME_PATTERNS = {
     'extinto': [r'EXTINTO', r'EXTINGUIR']
 }
 
+# chaves do resultado de extract_acordao_data, na ordem das colunas do CSV
+COLUMNS = [
+    "processo",
+    "tipo_processo",
+    "data_julgamento",
+    "estado",
+    # rótulos de partes (preenchidos se encontradas)
+    "AGRAVANTE",
+    "AGRAVADO",
+    "RECORRENTE",
+    "RECORRIDO",
+    "EMBARGANTE",
+    "EMBARGADO",
+    "AUTOR",
+    "REU",
+    "INTERESSADO",
+    "banco",
+    # "texto_voto",
+    # "dispositivo",
+    "decisao_para_banco"
+]
+
+MESES = {
+    "janeiro": 1, "fevereiro": 2, "março": 3, "marco": 3, "abril": 4,
+    "maio": 5, "junho": 6, "julho": 7, "agosto": 8, "setembro": 9,
+    "outubro": 10, "novembro": 11, "dezembro": 12
+}
+_DIAS_NO_MES = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+TIPOS_PROCESSO = ['AGRAVO EM RECURSO ESPECIAL','RECURSO ESPECIAL','AGRAVO INTERNO','AGRAVO DE INSTRUMENTO','EMBARGOS DE DECLARAÇÃO']
+
+# -----------------------
+# Padrões compilados (uma única vez, na importação do módulo)
+# -----------------------
+_RE_WS = re.compile(r'\s+')
+_RE_MULTI_WS = re.compile(r'\s{2,}')
+
+_RE_RELATORIO = re.compile(r'(RELAT[ÓO]RIO|RELATORIO)', re.IGNORECASE)
+_RE_VOTO = re.compile(r'\bVOTO\b|\bVOTO DO RELATOR\b|\bVOTOS\b', re.IGNORECASE)
+# 'LABEL : NOMES' seguido das linhas de continuação (não vazias e que não abrem novo rótulo).
+# Aplicado ao bloco com as linhas já aparadas; espaços do rótulo não atravessam quebras de linha.
+_LABEL = r'(?:[A-ZÀ-Ý0-9]|[^\S\n]){3,50}'
+_HWS = r'[^\S\n]*'
+_RE_PARTES = re.compile(
+    rf'^(?P<label>{_LABEL}){_HWS}[:\-–]{_HWS}(?P<value>.+)$'
+    rf'(?P<cont>(?:\n(?!{_LABEL}{_HWS}[:\-–]).+)*)',
+    re.MULTILINE
+)
+# papéis na forma normalizada (RÉU -> REU), na ordem de ROLE_LABELS, para rótulos já normalizados
+_ROLES_NORM = list(dict.fromkeys(normalize_upper(r) for r in ROLE_LABELS))
+_RE_ROLE = re.compile('|'.join('(' + re.escape(r) + ')' for r in _ROLES_NORM))
+
+# padrões do número do processo, em ordem de prioridade, fundidos numa única alternação;
+# o `\b` comum a todos fica fora da alternação, descartando de uma vez as posições no meio de palavras
+_RE_PROCESSO = re.compile(r'\b(?:' + '|'.join('(' + p + ')' for p in (
+    r'N(?:º|°|o)\s*[:.]?\s*([0-9]{4,}[0-9\.\-/]*)\s*(?:-\s*([A-Z]{2}))',
+    r'PROCESSO\s*(?:N(?:º|o)\.?)\s*([0-9./-]+)\s*(?:-\s*([A-Z]{2}))?',
+    r'RECURSO ESPECIAL\s*(?:N(?:º|o)\.?)\s*([0-9]+)\s*(?:-\s*([A-Z]{2}))',
+    r'REsp\.?\s*([0-9./-]+)\b',
+    r'Processo:\s*([0-9./-]+)\s*(?:-\s*([A-Z]{2}))?'
+)) + ')', re.IGNORECASE)
+_RE_UF = re.compile(r'[A-Z]{2}')
+_RE_UF_TAIL = re.compile(r'-\s*([A-Z]{2})')
+
+# o tipo aparece no cabeçalho: basta varrer o início do documento
+_TIPO_PREFIX = 2000
+_RE_TIPO = re.compile(
+    r'\b(?:' + '|'.join('(' + re.escape(t) + ')' for t in TIPOS_PROCESSO) + r')\b',
+    re.IGNORECASE
+)
+_RE_TIPO_CABECALHO = re.compile(r'^(.*?)\s+N(?:º|o|°)\b', re.IGNORECASE)
+
+_RE_DATA_TEXTO = re.compile(r'(\d{1,2})\s+de\s+([a-zçãéíóú]+)\s+de\s+(\d{4})', re.IGNORECASE)
+_RE_DATA_NUM = re.compile(r'(\d{1,2})[\/\-](\d{1,2})[\/\-](\d{4})')
+
+_RE_BANCO = re.compile(r'\bBANCO\s+([A-ZÀ-Ý0-9\.\-\/\s,&]{2,80}?)\b', re.IGNORECASE)
+_RE_SA = re.compile(r'([A-Z][A-Z\s\.\-,&]{3,80}S\.A\.?)', re.IGNORECASE)
+
+_RE_ACORDAM = re.compile(r'\bACORDAM\b', re.IGNORECASE)
+_RE_DISPOSITIVO = re.compile(r'\bDISPOSITIVO\b', re.IGNORECASE)
+# tamanho do trecho capturado após a âncora do dispositivo
+_DISPOSITIVO_LEN = 2000
+
+_OUTCOME_RE = re.compile(
+    '|'.join(f'(?P<{key}>{"|".join(pats)})' for key, pats in OUTCOME_PATTERNS.items()),
+    re.IGNORECASE
+)
+
 # -----------------------
 # Extração de blocos e partes
 # -----------------------
 def extract_partes_block(txt: str) -> str:
     """Retorna um bloco plausível contendo as partes (entre RELATÓRIO e VOTO ou início e VOTO)."""
-    m_rel = re.search(r'(RELAT[ÓO]RIO|RELATORIO)', txt, flags=re.IGNORECASE)
-    m_voto = re.search(r'\bVOTO\b|\bVOTO DO RELATOR\b|\bVOTOS\b', txt, flags=re.IGNORECASE)
+    m_rel = _RE_RELATORIO.search(txt)
+    m_voto = _RE_VOTO.search(txt)
     if m_rel and m_voto and m_rel.start() < m_voto.start():
         return txt[m_rel.end():m_voto.start()]
     if m_voto:
@@ -62,34 +177,23 @@ def extract_partes_from_block(block: str) -> Dict[str, str]:
     Captura rótulos do tipo 'AGRAVANTE: Nome', aceitando continuação em linhas seguintes.
     """
     partes: Dict[str, List[str]] = {}
-    lines = block.splitlines()
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
-        # padrão 'LABEL : NAMES' (LABEL tipicamente em maiúsculas)
-        m = re.match(r'^([A-ZÀ-Ý0-9\s]{3,50})\s*[:\-–]\s*(.+)$', line)
-        if m:
-            label_raw = m.group(1).strip()
-            name = m.group(2).strip()
-            # determinar se label corresponde a um role conhecido
-            matched_role = None
-            label_upper = normalize_upper(label_raw)
-            for r in ROLE_LABELS:
-                if r in label_upper:
-                    matched_role = r
-                    break
-            if matched_role:
-                # anexar linhas seguintes que parecem continuação (não um novo rótulo)
-                j = i + 1
-                while j < len(lines) and lines[j].strip() and not re.match(r'^[A-ZÀ-Ý0-9\s]{3,50}\s*[:\-–]', lines[j].strip()):
-                    name += ' ' + lines[j].strip()
-                    j += 1
-                clean_name = normalize_text(name)
-                if clean_name:
-                    partes.setdefault(matched_role, []).append(clean_name)
-                i = j
-                continue
-        i += 1
+    block = '\n'.join(line.strip() for line in block.splitlines())
+    # padrão 'LABEL : NAMES' (LABEL tipicamente em maiúsculas), numa única varredura do bloco
+    for m in _RE_PARTES.finditer(block):
+        # determinar se label corresponde a um role conhecido
+        label_upper = normalize_upper(m.group('label').strip())
+        if label_upper in _ROLE_SET:
+            matched_role = label_upper
+        else:
+            # rótulos compostos ('RECORRENTE AGRAVANTE', 'AUTORA'): papel de maior prioridade contido no rótulo
+            m_role = _search_by_priority(_RE_ROLE, label_upper)
+            matched_role = _ROLES_NORM[m_role.lastindex - 1] if m_role else None
+        if matched_role:
+            # anexar linhas seguintes que parecem continuação (não um novo rótulo)
+            name = m.group('value').strip() + m.group('cont').replace('\n', ' ')
+            clean_name = normalize_text(name)
+            if clean_name:
+                partes.setdefault(matched_role, []).append(clean_name)
     # converter listas para string única sem repetições
     partes_flat: Dict[str, str] = {}
     for role, names in partes.items():
@@ -104,47 +208,52 @@ def extract_partes_from_block(block: str) -> Dict[str, str]:
         partes_flat[role] = '; '.join(unique) if unique else None
     return partes_flat
 
+def normalize_partes(partes: Dict[str, Optional[str]]) -> Dict[str, List[str]]:
+    """Converte {ROLE: "Nome A; Nome B"} em {ROLE: ["NOME A", "NOME B"]} (maiúsculas, sem acentos)."""
+    return {role: [normalize_upper(nm) for nm in names.split(';')] for role, names in partes.items() if names}
+
 # -----------------------
 # Processo, tipo, data, estado
 # -----------------------
 def extract_processo_and_estado(txt: str) -> Tuple[Optional[str], Optional[str]]:
-    patterns = [
-        r'\bN(?:º|°|o)\s*[:.]?\s*([0-9]{4,}[0-9\.\-/]*)\s*(?:-\s*([A-Z]{2}))',
-        r'\bPROCESSO\s*(?:N(?:º|o)\.?)\s*([0-9./-]+)\s*(?:-\s*([A-Z]{2}))?',
-        r'\bRECURSO ESPECIAL\s*(?:N(?:º|o)\.?)\s*([0-9]+)\s*(?:-\s*([A-Z]{2}))',
-        r'\bREsp\.?\s*([0-9./-]+)\b',
-        r'\bProcesso:\s*([0-9./-]+)\s*(?:-\s*([A-Z]{2}))?'
-    ]
-    for pat in patterns:
-        m = re.search(pat, txt, flags=re.IGNORECASE)
-        if m:
-            groups = [g for g in m.groups() if g]
-            if groups:
-                proc = groups[0].strip()
-                estado = None
-                # se houver grupo com sigla
-                if len(groups) > 1 and re.fullmatch(r'[A-Z]{2}', groups[-1].strip()):
-                    estado = groups[-1].strip().upper()
-                else:
-                    tail = txt[m.end(): m.end()+40]
-                    m2 = re.search(r'-\s*([A-Z]{2})', tail)
-                    if m2:
-                        estado = m2.group(1)
-                return proc, estado
+    m = _search_by_priority(_RE_PROCESSO, txt)
+    if m:
+        # grupos internos da alternativa casada (os das demais alternativas são None)
+        groups = [g for g in m.groups()[m.lastindex:] if g]
+        if groups:
+            proc = groups[0].strip()
+            estado = None
+            # se houver grupo com sigla
+            if len(groups) > 1 and _RE_UF.fullmatch(groups[-1].strip()):
+                estado = groups[-1].strip().upper()
+            else:
+                tail = txt[m.end(): m.end()+40]
+                m2 = _RE_UF_TAIL.search(tail)
+                if m2:
+                    estado = m2.group(1)
+            return proc, estado
     return None, None
 
 def extract_tipo_processo(txt: str) -> Optional[str]:
-    tipos = ['AGRAVO EM RECURSO ESPECIAL','RECURSO ESPECIAL','AGRAVO INTERNO','AGRAVO DE INSTRUMENTO','EMBARGOS DE DECLARAÇÃO']
-    for t in tipos:
-        if re.search(r'\b' + re.escape(t) + r'\b', txt, flags=re.IGNORECASE):
-            return t
+    m = _search_by_priority(_RE_TIPO, txt, _TIPO_PREFIX)
+    if m:
+        return TIPOS_PROCESSO[m.lastindex - 1]
     # fallback: tentar primeiro cabeçalho
-    first_line = txt.splitlines()[0] if txt.splitlines() else ''
-    m = re.match(r'^(.*?)\s+N(?:º|o|°)\b', first_line, flags=re.IGNORECASE)
+    head = txt.split('\n', 1)[0].splitlines()
+    first_line = head[0] if head else ''
+    m = _RE_TIPO_CABECALHO.match(first_line)
     if m:
         return m.group(1).strip()
     return None
 
+def _format_data(dia: int, mes: int, ano: int) -> Optional[str]:
+    """Formata DD/MM/YYYY se a data existir (mesma validação de datetime.date, sem criar o objeto)."""
+    if ano < 1 or not 1 <= mes <= 12:
+        return None
+    if not 1 <= dia <= _DIAS_NO_MES[mes - 1] + (mes == 2 and calendar.isleap(ano)):
+        return None
+    return f"{dia:02d}/{mes:02d}/{ano}"
+
 def extract_data_julgamento(txt: str) -> Optional[str]:
     """
     Extrai a data de julgamento e retorna no formato DD/MM/YYYY.
@@ -153,55 +262,51 @@ def extract_data_julgamento(txt: str) -> Optional[str]:
       - 'JULGADO: 28/08/2023'
       - '28/08/2023'
     """
-    meses = {
-        "janeiro": 1, "fevereiro": 2, "março": 3, "marco": 3, "abril": 4,
-        "maio": 5, "junho": 6, "julho": 7, "agosto": 8, "setembro": 9,
-        "outubro": 10, "novembro": 11, "dezembro": 12
-    }
-
     # padrão textual: 'Brasília, 28 de agosto de 2023'
-    m_texto = re.search(
-        r'(\d{1,2})\s+de\s+([a-zçãéíóú]+)\s+de\s+(\d{4})', txt, flags=re.IGNORECASE
-    )
+    m_texto = _RE_DATA_TEXTO.search(txt)
     if m_texto:
         dia = int(m_texto.group(1))
         mes_nome = m_texto.group(2).lower()
         ano = int(m_texto.group(3))
-        mes = meses.get(mes_nome)
+        mes = MESES.get(mes_nome)
         if mes:
-            try:
-                return datetime.date(ano, mes, dia).strftime("%d/%m/%Y")
-            except ValueError:
-                pass
+            data = _format_data(dia, mes, ano)
+            if data:
+                return data
 
     # padrão numérico: JULGADO: 28/08/2023 ou PAUTA: dd/mm/yyyy JULGADO: dd/mm/yyyy
-    m_num = re.search(r'(\d{1,2})[\/\-](\d{1,2})[\/\-](\d{4})', txt)
+    m_num = _RE_DATA_NUM.search(txt)
     if m_num:
         dia, mes, ano = map(int, m_num.groups())
-        try:
-            return datetime.date(ano, mes, dia).strftime("%d/%m/%Y")
-        except ValueError:
-            pass
+        data = _format_data(dia, mes, ano)
+        if data:
+            return data
 
     return None
 
 # -----------------------
 # Banco detection
 # -----------------------
+_BANKS_UPPER = [b.upper() for b in COMMON_BANKS]
+
 def detect_bank(txt: str) -> Optional[str]:
     txt_n = normalize_upper(txt)
-    for b in COMMON_BANKS:
-        if b.upper() in txt_n:
+    for b, b_upper in zip(COMMON_BANKS, _BANKS_UPPER):
+        if b_upper in txt_n:
             return b
-    m = re.search(r'\bBANCO\s+([A-ZÀ-Ý0-9\.\-\/\s,&]{2,80}?)\b', txt, flags=re.IGNORECASE)
+    m = _RE_BANCO.search(txt)
     if m:
         cand = m.group(0).strip()
-        cand = re.sub(r'\s{2,}', ' ', cand)
+        cand = _RE_MULTI_WS.sub(' ', cand)
         return normalize_text(cand)
-    m2 = re.search(r'([A-Z][A-Z\s\.\-,&]{3,80}S\.A\.?)', txt, flags=re.IGNORECASE)
+    m2 = _RE_SA.search(txt)
     if m2:
         cand = normalize_text(m2.group(1))
-        matches = get_close_matches(cand.upper(), [b.upper() for b in COMMON_BANKS], n=1, cutoff=0.7)
+        if fuzz_process is not None:
+            match = fuzz_process.extractOne(cand.upper(), _BANKS_UPPER, scorer=fuzz.ratio, score_cutoff=70)
+            matches = [match[0]] if match else []
+        else:
+            matches = get_close_matches(cand.upper(), _BANKS_UPPER, n=1, cutoff=0.7)
         if matches:
             # title-case match
             return matches[0].title()
@@ -230,41 +335,41 @@ def detect_bank(txt: str) -> Optional[str]:
 #     return None
 
 def extract_dispositivo(txt: str) -> Optional[str]:
-    m = re.search(r'\bACORDAM\b(.{0,2000})', txt, flags=re.IGNORECASE | re.DOTALL)
+    # localizada a âncora, o trecho é recortado por fatia (sem `.{0,N}` no regex)
+    m = _RE_ACORDAM.search(txt) or _RE_DISPOSITIVO.search(txt)
     if m:
-        return m.group(0).strip()
-    m2 = re.search(r'\bDISPOSITIVO\b(.{0,2000})', txt, flags=re.IGNORECASE | re.DOTALL)
-    if m2:
-        return m2.group(0).strip()
+        return txt[m.start():m.end() + _DISPOSITIVO_LEN].strip()
     tail = txt[-1200:].strip()
     return tail if tail else None
 
 # -----------------------
 # Inferir decisão p/ banco (heurística)
 # -----------------------
-def infer_decision_for_bank(dispositivo: Optional[str], partes: Dict[str, str], banco_name: Optional[str]) -> Optional[str]:
+# distância máxima entre os termos do fallback (evita `.*` varrendo o dispositivo inteiro)
+_FALLBACK_GAP = 200
+
+@functools.lru_cache(maxsize=64)
+def _bank_fallback_re(bn_token: str, decisao: str) -> re.Pattern:
+    """Padrão 'NEGA ... PROVIMENTO ... BANCO' ('contraria') ou 'DAR PROVIMENTO ... BANCO' ('favoravel')."""
+    gap = '.{0,%d}' % _FALLBACK_GAP
+    prefix = 'NEGA' + gap + 'PROVIMENTO' + gap if decisao == 'contraria' else 'DAR PROVIMENTO' + gap
+    return re.compile(prefix + re.escape(bn_token), re.IGNORECASE)
+
+def infer_decision_for_bank(dispositivo: Optional[str], partes_norm: Dict[str, List[str]], banco_name: Optional[str]) -> Optional[str]:
+    """`partes_norm` é o mapa {ROLE: [nomes normalizados]} de `normalize_partes`."""
     if not dispositivo:
         return None
     dnorm = normalize_upper(dispositivo)
-    matched_key = None
-    for key, pats in OUTCOME_PATTERNS.items():
-        for pat in pats:
-            if re.search(pat, dnorm, flags=re.IGNORECASE):
-                matched_key = key
-                break
-        if matched_key:
-            break
+    m = _search_by_priority(_OUTCOME_RE, dnorm)
+    matched_key = m.lastgroup if m else None
+    if banco_name:
+        bn_token = normalize_upper(banco_name.split()[0])
+        bn_norm = normalize_upper(banco_name)
     # identificar papel do banco nas partes
     bank_roles = []
-    if banco_name and partes:
-        bn_token = normalize_upper(banco_name.split()[0])
-        for role, names_str in partes.items():
-            if not names_str:
-                continue
-            # checar se qualquer nome da string contém token do banco
-            for nm in [n.strip() for n in names_str.split(';')]:
-                if bn_token in normalize_upper(nm) or normalize_upper(banco_name) in normalize_upper(nm):
-                    bank_roles.append(role)
+    if banco_name and partes_norm:
+        # checar se qualquer nome do papel contém token do banco
+        bank_roles = [role for role, nms in partes_norm.items() for nm in nms if bn_token in nm or bn_norm in nm]
     # heurística simples combinando matched_key e papel
     if matched_key:
         if matched_key in ('negar_provimento','julgar_improcedente','prejudicado','extinto'):
@@ -281,11 +386,9 @@ def infer_decision_for_bank(dispositivo: Optional[str], partes: Dict[str, str],
             return 'indeterminado'
     # fallback: procurar "nega provimento a (recurso de) BANCO" ou similar
     if banco_name:
-        bn_simple = normalize_upper(banco_name.split()[0])
-        if re.search(r'NEGA.*PROVIMENTO.*' + re.escape(bn_simple), normalize_upper(dispositivo), flags=re.IGNORECASE):
-            return 'contraria'
-        if re.search(r'DAR PROVIMENTO.*' + re.escape(bn_simple), normalize_upper(dispositivo), flags=re.IGNORECASE):
-            return 'favoravel'
+        for decisao in ('contraria', 'favoravel'):
+            if _bank_fallback_re(bn_token, decisao).search(dnorm):
+                return decisao
     return 'indeterminado'
 
 # -----------------------
@@ -300,26 +403,7 @@ def extract_acordao_data(text: str) -> Dict[str, Any]:
     Valores: strings ou None. Partes armazenadas em strings únicas separadas por '; ' sem repetição.
     """
     # inicializar resultado com chaves previstas (partes como None por padrão)
-    result: Dict[str, Any] = {
-        "processo": None,
-        "tipo_processo": None,
-        "data_julgamento": None,
-        "estado": None,
-        # predefinir rótulos de partes (serão preenchidos se encontradas)
-        "AGRAVANTE": None,
-        "AGRAVADO": None,
-        "RECORRENTE": None,
-        "RECORRIDO": None,
-        "EMBARGANTE": None,
-        "EMBARGADO": None,
-        "AUTOR": None,
-        "REU": None,
-        "INTERESSADO": None,
-        "banco": None,
-        # "texto_voto": None,
-        # "dispositivo": None,
-        "decisao_para_banco": None
-    }
+    result: Dict[str, Any] = dict.fromkeys(COLUMNS)
 
     if not text or not text.strip():
         return result
@@ -367,7 +451,8 @@ def extract_acordao_data(text: str) -> Dict[str, Any]:
     #     result["dispositivo"] = dispositivo
 
     # decisao p/ banco (heurística)
-    decisao = infer_decision_for_bank(dispositivo, {k:v for k,v in result.items() if k in ROLE_LABELS}, banco)
+    partes_norm = normalize_partes({k:v for k,v in result.items() if k in ROLE_LABELS})
+    decisao = infer_decision_for_bank(dispositivo, partes_norm, banco)
     result["decisao_para_banco"] = decisao
 
     return result
@@ -1,23 +1,51 @@
 import os
+import csv
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
 from parser import pdf_parser
-from extract_data import extract_acordao_data
+from extract_data import COLUMNS, extract_acordao_data
 
-def build_dataframe(diretorio):
-    data = []
+# converte o dicionário de extract_acordao_data numa tupla na ordem de COLUMNS
+_as_row = itemgetter(*COLUMNS)
+
+def list_pdfs(diretorio):
+    caminhos = []
 
     for raiz, _, arquivos in os.walk(diretorio):
         for arquivo in arquivos:
             if arquivo.lower().endswith(".pdf"):
-                text = pdf_parser(os.path.join(raiz, arquivo))
-                acordao_data = extract_acordao_data(text)
-                data.append(acordao_data)
+                caminhos.append(os.path.join(raiz, arquivo))
+
+    return caminhos
+
+def _process_one(caminho):
+    return _as_row(extract_acordao_data(pdf_parser(caminho)))
 
-    df = pd.DataFrame(data)
+def iter_rows(diretorio):
+    """Gera uma tupla (na ordem de COLUMNS) por PDF, à medida que os processos terminam."""
+    caminhos = list_pdfs(diretorio)
+
+    # cada PDF é independente: distribui a extração entre processos (um por núcleo)
+    with ProcessPoolExecutor() as executor:
+        yield from executor.map(_process_one, caminhos, chunksize=8)
+
+def build_dataframe(diretorio):
+    df = pd.DataFrame.from_records(list(iter_rows(diretorio)), columns=COLUMNS)
 
     return df
 
+def write_csv(diretorio, destino):
+    """
+    Grava o CSV linha a linha, sem materializar todos os acórdãos em memória.
+    Mesmo formato de build_dataframe(diretorio).to_csv(destino), com a coluna de índice.
+    """
+    with open(destino, "w", newline="", encoding="utf-8") as arquivo:
+        writer = csv.writer(arquivo, lineterminator="\n")
+        writer.writerow(["", *COLUMNS])
+        for i, row in enumerate(iter_rows(diretorio)):
+            writer.writerow((i, *row))
+
 # Exemplo de uso:
 if __name__ == "__main__":
-    df = build_dataframe('./data/')
-    df.to_csv('acordaos.csv')
\ No newline at end of file
+    write_csv('./data/', 'acordaos.csv')
\ No newline at end of file
@@ -1,18 +1,117 @@
-from PyPDF2 import PdfReader
+import io
+import os
+import hashlib
+from importlib import metadata
+
+try:
+    import xxhash
+except ImportError:  # sem xxhash: blake2b da biblioteca padrão
+    xxhash = None
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # PDFium indisponível: recorre ao pdfminer.six ou ao PyPDF2
+    pdfium = None
+
+try:
+    from pdfminer.high_level import extract_text as pdfminer_extract_text
+except ImportError:
+    pdfminer_extract_text = None
+
+# biblioteca usada na extração; os textos diferem entre elas (quebras de linha, espaços)
+if pdfium is not None:
+    _BACKEND = "pypdfium2"
+elif pdfminer_extract_text is not None:
+    _BACKEND = "pdfminer.six"
+else:
+    _BACKEND = "PyPDF2"
+
+def _backend_tag(nome):
+    try:
+        return f"{nome}-{metadata.version(nome)}"
+    except metadata.PackageNotFoundError:
+        return nome
+
+# textos já extraídos, indexados pela biblioteca (e versão) e pelo hash do conteúdo do PDF
+CACHE_DIR = ".cache"
+_CACHE_TAG = _backend_tag(_BACKEND)
+
+def _pdfium_text(dados):
+    doc = pdfium.PdfDocument(dados)
+    try:
+        paginas = []
+        for pagina in doc:
+            textpage = pagina.get_textpage()
+            paginas.append(textpage.get_text_range())
+            # liberar objetos nativos assim que possível
+            textpage.close()
+            pagina.close()
+        return "\n".join(paginas)
+    finally:
+        doc.close()
+
+def _pypdf2_text(dados):
+    from PyPDF2 import PdfReader
+
+    paginas = []
+    leitor = PdfReader(io.BytesIO(dados))
+    for pagina in leitor.pages:
+        paginas.append(pagina.extract_text() or "")
+    return "\n".join(paginas)
+
+def _extract_text(dados):
+    if _BACKEND == "pypdfium2":
+        return _pdfium_text(dados)
+    if _BACKEND == "pdfminer.six":
+        return pdfminer_extract_text(io.BytesIO(dados))
+    return _pypdf2_text(dados)
+
+def _digest(dados):
+    if xxhash is not None:
+        return xxhash.xxh3_64_hexdigest(dados)
+    return hashlib.blake2b(dados, digest_size=16).hexdigest()
 
 def pdf_parser(pdf_path):
     """
     Extrai o texto de um arquivo PDF.
 
+    O arquivo é lido uma única vez e processado por pdf_parser_from_bytes.
+
     Parâmetros:
         pdf_path (str): Caminho para o arquivo PDF.
 
     Retorna:
         str: Texto completo extraído do PDF.
     """
-    texto = ""
     with open(pdf_path, "rb") as arquivo:
-        leitor = PdfReader(arquivo)
-        for pagina in leitor.pages:
-            texto += pagina.extract_text() or ""
+        return pdf_parser_from_bytes(arquivo.read())
+
+def pdf_parser_from_bytes(dados):
+    """
+    Extrai o texto de um PDF já carregado em memória.
+
+    Usa o PDFium (pypdfium2) quando disponível; caso contrário, o pdfminer.six
+    e, em último caso, o PyPDF2. O texto fica guardado em CACHE_DIR, indexado
+    pela biblioteca usada (com versão) e pelo hash do conteúdo, e é reaproveitado
+    enquanto nem o PDF nem o extrator mudarem.
+
+    Parâmetros:
+        dados (bytes): Conteúdo do arquivo PDF.
+
+    Retorna:
+        str: Texto completo extraído do PDF.
+    """
+    cache = os.path.join(CACHE_DIR, f"{_CACHE_TAG}-{_digest(dados)}.txt")
+    if os.path.exists(cache):
+        with open(cache, encoding="utf-8", newline="") as f:
+            return f.read()
+
+    texto = _extract_text(dados)
+
+    # escrita atômica: vários processos podem extrair PDFs em paralelo
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp = f"{cache}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8", newline="") as f:
+        f.write(texto)
+    os.replace(tmp, cache)
     return texto
\ No newline at end of file